@@ -10,9 +10,76 @@ Example:
         print('Login successful')
 """
 
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, tzinfo
+from functools import lru_cache
+from types import MappingProxyType
+import hashlib
+import hmac
+import os
+import re
+import threading
+import time
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import (Optional, Dict, Any, Iterable, List, Mapping, Sequence,
+                    Tuple)
+
+try:
+    # Faster drop-in decoder when installed; both raise ValueError subclasses
+    import orjson as _json
+except ImportError:
+    import json as _json  # type: ignore[no-redef]
+
+
+# Compiled once at import so each validation is a single C-level match
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+# Longest address SMTP allows (RFC 5321); also bounds the validation cache
+_EMAIL_MAX_LENGTH = 254
+
+# scrypt cost parameters for stored password hashes (16 MiB per hash)
+_SCRYPT_N = 2 ** 14
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+_SALT_SIZE = 16
+
+# Shared session so API calls reuse pooled keep-alive connections instead of
+# paying a fresh TCP and TLS handshake on every request. Concurrent callers
+# beyond the pool size wait for a pooled connection rather than opening
+# throwaway ones. Connection failures and 502/503/504 responses are retried
+# with backoff on the same pool; 404 and other client errors are not. Read
+# timeouts are not retried either, so they still surface as
+# requests.exceptions.Timeout rather than ConnectionError. Worst case is
+# four 10s attempts plus 1.2s of backoff, about 41s per lookup.
+_POOL_MAXSIZE = 50
+_RETRY = Retry(
+    total=3,
+    read=False,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    raise_on_status=False,
+    respect_retry_after_header=False,
+)
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=_POOL_MAXSIZE,
+                       max_retries=_RETRY, pool_block=True)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+# Bounded LRU cache of API responses keyed on user ID. Entries store their
+# expiry time (time.monotonic()) and the raw JSON payload, which is decoded
+# on every hit so callers never share mutable data; misses (404) are cached
+# as None and expire sooner than hits.
+_USER_CACHE: "OrderedDict[int, Tuple[float, Optional[bytes]]]" = (
+    OrderedDict()
+)
+_USER_CACHE_LOCK = threading.Lock()
+_USER_CACHE_MAXSIZE = 1024
+_USER_CACHE_TTL = 600.0
+_USER_CACHE_MISS_TTL = 60.0
 
 
 # Custom exceptions
@@ -61,13 +128,34 @@ class userAccount:
         True
     """
 
+    __slots__ = (
+        "Username",
+        "Age",
+        "_info",
+        "_info_view",
+        "_email_parts",
+        "_salt",
+        "_pw_hash",
+        "created_at",
+        "_last_login_ns",
+        "_last_login_tz",
+    )
+
     Username: str
-    Password: str
-    Email: str
     Age: int
+    _info: Dict[str, Any]
+    _info_view: Mapping[str, Any]
+    _email_parts: Optional[Tuple[str, str]]
+    _salt: bytes
+    _pw_hash: bytes
     created_at: datetime
-    last_login: Optional[datetime]
-    is_active: bool
+    _last_login_ns: Optional[int]
+    _last_login_tz: Optional[tzinfo]
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "userAccount":
+        # Explicit so from_trusted() can allocate instances without running
+        # __init__ when the module is compiled with mypyc
+        return super().__new__(cls)
 
     def __init__(self, username: str, password: str, email: str,
                  age: int) -> None:
@@ -88,24 +176,218 @@ class userAccount:
             >>> user = userAccount('john', 'pass123', 'john@email.com', 25)
         """
         # Input validation
-        if not isinstance(username, str) or len(username.strip()) == 0:
+        if isinstance(username, str):
+            username = username.strip()
+        if not isinstance(username, str) or not username:
             raise ValueError("Username must be a non-empty string")
         if not isinstance(password, str) or len(password) < 6:
             raise ValueError("Password must be at least 6 characters long")
-        if not validate_email(email):
-            raise InvalidEmailError(f"Invalid email format: {email}")
+        validate_email(email)
         if not isinstance(age, int) or age < 0 or age > 150:
             raise ValueError("Age must be an integer between 0 and 150")
-        # Set attributes only after validation
-        self.Username = username.strip()
-        self.Password = password
-        self.Email = email.strip().lower()
+        # Set attributes only after validation. The profile is also kept in
+        # the dict behind get_account_info() so it never has to be rebuilt;
+        # Email and is_active are stored only there, since they can change.
+        email = email.strip().lower()
+        self.Username = username
         self.Age = age
+        self._info = {
+            "username": username,
+            "email": email,
+            "age": age,
+            "active": True,
+        }
+        self._info_view = MappingProxyType(self._info)
+        self._email_parts = None
+        self._salt = os.urandom(_SALT_SIZE)
+        self._pw_hash = _hash_password(password, self._salt)
         self.created_at = datetime.now()
-        self.last_login = None
-        self.is_active = True
+        self._last_login_ns = None
+        self._last_login_tz = None
+
+    @classmethod
+    def from_trusted(cls, username: str, password_hash: bytes, salt: bytes,
+                     email: str, age: int, *, created_at: datetime,
+                     last_login: Optional[datetime] = None,
+                     is_active: bool = True) -> "userAccount":
+        """
+        Rebuild an account from already-validated data without re-checking.
+
+        Intended for bulk loads from trusted storage such as database rows;
+        user-facing signup should go through the validating constructor.
+
+        Args:
+            username (str): The normalized username
+            password_hash (bytes): The stored password hash
+            salt (bytes): The salt the password hash was derived with
+            email (str): The normalized email address
+            age (int): The user's age
+            created_at (datetime): Account creation timestamp
+            last_login (Optional[datetime]): Last successful login timestamp
+            is_active (bool): Account active status
+
+        Returns:
+            userAccount: The reconstructed account
+
+        Example:
+            >>> copy = userAccount.from_trusted(
+            ...     user.Username, user.password_hash, user.salt,
+            ...     user.Email, user.Age, created_at=user.created_at,
+            ...     last_login=user.last_login, is_active=user.is_active)
+        """
+        self = cls.__new__(cls)
+        self.Username = username
+        self.Age = age
+        self._info = {
+            "username": username,
+            "email": email,
+            "age": age,
+            "active": is_active,
+        }
+        self._info_view = MappingProxyType(self._info)
+        self._email_parts = None
+        self._salt = salt
+        self._pw_hash = password_hash
+        self.created_at = created_at
+        self.last_login = last_login
+        return self
+
+    @classmethod
+    def bulk_create(cls, usernames: Sequence[str], passwords: Sequence[str],
+                    emails: Sequence[str],
+                    ages: Sequence[int]) -> List["userAccount"]:
+        """
+        Create many accounts from column-wise inputs.
+
+        Each column is validated as a whole before any account is built,
+        applying the same rules as the constructor, and the accounts are
+        then assembled without repeating the per-account checks. All
+        accounts share one creation timestamp.
+
+        Args:
+            usernames (Sequence[str]): The users' unique usernames
+            passwords (Sequence[str]): The users' passwords
+            emails (Sequence[str]): The users' email addresses
+            ages (Sequence[int]): The users' ages
+
+        Returns:
+            List[userAccount]: The new accounts, in input order
+
+        Raises:
+            ValueError: If the columns differ in length or any value is
+                invalid
+            InvalidEmailError: If any email format is invalid
 
-    def login(self, password: str) -> bool:
+        Example:
+            >>> users = userAccount.bulk_create(
+            ...     ['john', 'jane'], ['pass123', 'pass456'],
+            ...     ['john@email.com', 'jane@email.com'], [25, 31])
+        """
+        if not len(usernames) == len(passwords) == len(emails) == len(ages):
+            raise ValueError("All columns must have the same length")
+        if not all(isinstance(name, str) for name in usernames):
+            raise ValueError("Username must be a non-empty string")
+        names = [name.strip() for name in usernames]
+        if not all(names):
+            raise ValueError("Username must be a non-empty string")
+        if not all(isinstance(pw, str) and len(pw) >= 6 for pw in passwords):
+            raise ValueError("Password must be at least 6 characters long")
+        if not all(isinstance(email, str) for email in emails):
+            raise TypeError("Email must be a string")
+        stripped = [email.strip() for email in emails]
+        if any(len(email) > _EMAIL_MAX_LENGTH for email in stripped):
+            raise InvalidEmailError(
+                f"Email must be at most {_EMAIL_MAX_LENGTH} characters long")
+        addresses = [email.lower() for email in stripped]
+        for address in addresses:
+            error = _email_format_error(address)
+            if error is not None:
+                raise InvalidEmailError(error)
+        if not all(isinstance(age, int) and 0 <= age <= 150 for age in ages):
+            raise ValueError("Age must be an integer between 0 and 150")
+
+        created_at = datetime.now()
+        accounts = []
+        for name, password, address, age in zip(names, passwords,
+                                                 addresses, ages):
+            salt = os.urandom(_SALT_SIZE)
+            accounts.append(cls.from_trusted(
+                name, _hash_password(password, salt), salt, address, age,
+                created_at=created_at,
+            ))
+        return accounts
+
+    @property
+    def password_hash(self) -> bytes:
+        """bytes: The stored password hash, for persisting the account."""
+        return self._pw_hash
+
+    @property
+    def salt(self) -> bytes:
+        """bytes: The salt the password hash was derived with."""
+        return self._salt
+
+    @property
+    def last_login(self) -> Optional[datetime]:
+        """
+        Optional[datetime]: Last successful login timestamp.
+
+        Reported in the timezone of the last assigned value, or as naive
+        local time if that value was naive or none was assigned.
+        """
+        # Stored as epoch nanoseconds so login() avoids building a datetime
+        if self._last_login_ns is None:
+            return None
+        return datetime.fromtimestamp(self._last_login_ns / 1e9,
+                                      self._last_login_tz)
+
+    @last_login.setter
+    def last_login(self, value: Optional[datetime]) -> None:
+        if value is None:
+            self._last_login_ns = None
+            self._last_login_tz = None
+        else:
+            self._last_login_ns = round(value.timestamp() * 1e6) * 1000
+            self._last_login_tz = value.tzinfo
+
+    @property
+    def Email(self) -> str:
+        """str: The user's email address."""
+        return self._info["email"]
+
+    @Email.setter
+    def Email(self, value: str) -> None:
+        self._info["email"] = value
+        self._email_parts = None
+
+    @property
+    def email_local(self) -> str:
+        """str: The part of the email address before the '@'."""
+        return self._split_email()[0]
+
+    @property
+    def email_domain(self) -> str:
+        """str: The part of the email address after the '@'."""
+        return self._split_email()[1]
+
+    def _split_email(self) -> Tuple[str, str]:
+        """Split the email address on first use and memoize the parts."""
+        parts = self._email_parts
+        if parts is None:
+            local, _, domain = self._info["email"].partition("@")
+            parts = self._email_parts = (local, domain)
+        return parts
+
+    @property
+    def is_active(self) -> bool:
+        """bool: Account active status."""
+        return self._info["active"]
+
+    @is_active.setter
+    def is_active(self, value: bool) -> None:
+        self._info["active"] = value
+
+    def login(self, password: object) -> bool:
         """
         Authenticate user with provided password.
 
@@ -122,34 +404,42 @@ class userAccount:
             False
         """
 
-        if password == self.Password:
-            self.last_login = datetime.now()
+        if self._verify_password(password):
+            self._last_login_ns = time.time_ns()
             return True
         else:
             return False
 
-    def get_account_info(self) -> Dict[str, Any]:
+    def get_account_info(self) -> Mapping[str, Any]:
         """
         Retrieve account information.
 
+        The same read-only view is returned on every call. It reflects
+        later changes to Email and is_active; username and age are
+        recorded when the account is created. Copy it with dict() to keep
+        a snapshot.
+
         Returns:
-            dict: Dictionary containing username, email, age, and active
-            status.
+            Mapping: Read-only mapping containing username, email, age,
+            and active status.
 
         Example:
-            >>> user.get_account_info()
+            >>> dict(user.get_account_info())
             {'username': 'john', 'email': 'john@email.com', 'age': 25,
             'active': True}
         """
 
-        return {
-            "username": self.Username,
-            "email": self.Email,
-            "age": self.Age,
-            "active": self.is_active,
-        }
+        return self._info_view
+
+    def _verify_password(self, password: object) -> bool:
+        """Check a password against the stored hash in constant time."""
+        if not isinstance(password, str):
+            return False
+        candidate = _hash_password(password, self._salt)
+        return hmac.compare_digest(candidate, self._pw_hash)
 
-    def update_password(self, old_password: str, new_password: str) -> bool:
+    def update_password(self, old_password: object,
+                        new_password: str) -> bool:
         """
         Update the user's password if the old password is correct.
 
@@ -160,17 +450,38 @@ class userAccount:
         Returns:
             bool: True if password updated successfully, False otherwise
 
+        Raises:
+            TypeError: If new_password is not a string
+
         Example:
             >>> user.update_password('oldpass', 'newpass')
             True
         """
 
-        if self.login(old_password):
-            self.Password = new_password
+        if not isinstance(new_password, str):
+            raise TypeError("New password must be a string")
+        if self._verify_password(old_password):
+            self._salt = os.urandom(_SALT_SIZE)
+            self._pw_hash = _hash_password(new_password, self._salt)
             return True
         return False
 
 
+def _hash_password(password: str, salt: bytes) -> bytes:
+    """
+    Derive the stored hash for a password.
+
+    Args:
+        password (str): The plaintext password
+        salt (bytes): The per-user random salt
+
+    Returns:
+        bytes: 32-byte scrypt digest of the password
+    """
+    return hashlib.scrypt(password.encode(), salt=salt, n=_SCRYPT_N,
+                          r=_SCRYPT_R, p=_SCRYPT_P, dklen=32)
+
+
 def validate_email(email: str) -> bool:
     """
     Validate email address format with comprehensive checks.
@@ -187,26 +498,59 @@ def validate_email(email: str) -> bool:
     """
     if not isinstance(email, str):
         raise TypeError("Email must be a string")
-    email = email.strip().lower()
-    if not email:
-        raise InvalidEmailError("Email cannot be empty")
-    if email.count("@") != 1:
-        raise InvalidEmailError("Email must contain exactly one '@' symbol")
-    username, domain = email.split("@")
-    if not username or not domain:
-        raise InvalidEmailError("Email must have both username and"
-                                " domain parts")
-    if "." not in domain:
-        raise InvalidEmailError("Domain must contain at least one dot")
+    email = email.strip()
+    # Checked before the cached lookup so oversized input is never copied
+    # by lower() or kept as a cache key
+    if len(email) > _EMAIL_MAX_LENGTH:
+        raise InvalidEmailError(
+            f"Email must be at most {_EMAIL_MAX_LENGTH} characters long")
+    error = _email_format_error(email.lower())
+    if error is not None:
+        raise InvalidEmailError(error)
     return True
 
 
-def calculate_account_age(created_date: datetime) -> int:
+@lru_cache(maxsize=4096)
+def _email_format_error(email: str) -> Optional[str]:
+    """
+    Check a normalized email address.
+
+    Results are memoized, so repeat validations of the same address are a
+    single cache lookup whether it is valid or not.
+
+    Args:
+        email (str): Stripped, lowercased email address of at most
+            _EMAIL_MAX_LENGTH characters; callers check the length first
+            so the cache never holds oversized keys
+
+    Returns:
+        Optional[str]: Reason the address is invalid, or None if it is valid
+    """
+    if not email:
+        return "Email cannot be empty"
+    # str.find is a memchr-backed scan, so malformed addresses are rejected
+    # without allocating and before the regex engine runs
+    at = email.find("@")
+    if at < 0 or email.find("@", at + 1) >= 0:
+        return "Email must contain exactly one '@' symbol"
+    if at == 0 or at == len(email) - 1:
+        return "Email must have both username and domain parts"
+    if email.find(".", at + 1) < 0:
+        return "Domain must contain at least one dot"
+    if not _EMAIL_RE.match(email):
+        return f"Invalid email format: {email}"
+    return None
+
+
+def calculate_account_age(created_date: datetime,
+                          now: Optional[datetime] = None) -> int:
     """
     Calculate the age of an account in days.
 
     Args:
         created_date (datetime): The account creation date
+        now (Optional[datetime]): Reference time; defaults to the current
+            time. Pass it explicitly to reuse one timestamp across calls.
 
     Returns:
         int: Number of days since account creation
@@ -216,15 +560,41 @@ def calculate_account_age(created_date: datetime) -> int:
         365
     """
 
-    now = datetime.now()
+    if now is None:
+        now = datetime.now()
     diff = now - created_date
     return diff.days
 
 
+def calculate_account_ages(created_dates: List[datetime]) -> List[int]:
+    """
+    Calculate the ages of many accounts in days.
+
+    The current time is read once and shared by every account.
+
+    Args:
+        created_dates (List[datetime]): The account creation dates
+
+    Returns:
+        List[int]: Number of days since creation for each account
+
+    Example:
+        >>> calculate_account_ages([datetime(2023, 1, 1)])
+        [365]
+    """
+
+    now = datetime.now()
+    return [(now - created_date).days for created_date in created_dates]
+
+
 def fetch_user_data(user_id: int) -> Optional[Dict[str, Any]]:
     """
     Fetch user data from external API with error handling.
 
+    Responses are cached per user ID for a limited time, so repeat lookups
+    within the TTL are served without a network round trip. Each call
+    returns freshly decoded data.
+
     Args:
         user_id (int): User ID to fetch data for
 
@@ -235,23 +605,97 @@ def fetch_user_data(user_id: int) -> Optional[Dict[str, Any]]:
         NetworkError: If network request fails
         ValueError: If user_id is invalid
     """
+    _check_user_id(user_id)
+    with _USER_CACHE_LOCK:
+        entry = _USER_CACHE.get(user_id)
+        if entry is not None:
+            if time.monotonic() < entry[0]:
+                _USER_CACHE.move_to_end(user_id)
+                payload = entry[1]
+                return None if payload is None else _decode_user(payload)
+            del _USER_CACHE[user_id]
+    payload = _fetch_user_payload(user_id)
+    # Decode before caching so an invalid payload is never stored
+    data = None if payload is None else _decode_user(payload)
+    ttl = _USER_CACHE_TTL if payload is not None else _USER_CACHE_MISS_TTL
+    with _USER_CACHE_LOCK:
+        _USER_CACHE[user_id] = (time.monotonic() + ttl, payload)
+        _USER_CACHE.move_to_end(user_id)
+        if len(_USER_CACHE) > _USER_CACHE_MAXSIZE:
+            _USER_CACHE.popitem(last=False)
+    return data
+
+
+def fetch_users_data(
+    user_ids: Iterable[int]
+) -> Dict[int, Optional[Dict[str, Any]]]:
+    """
+    Fetch data for several users concurrently.
+
+    Requests are issued in parallel over the shared connection pool, so
+    the total wait is close to one round trip rather than one per user.
+    Duplicate IDs are fetched once and cached entries are reused.
+
+    The batch succeeds or fails as a whole: if any lookup fails, the first
+    NetworkError is raised once every lookup has finished and no results
+    are returned. Successful lookups are still cached, so retrying the
+    batch only re-requests the users that failed.
+
+    Args:
+        user_ids (Iterable[int]): User IDs to fetch data for
+
+    Returns:
+        Dict[int, Optional[Dict[str, Any]]]: User data keyed by user ID,
+        with None for users that were not found
+
+    Raises:
+        NetworkError: If any network request fails
+        ValueError: If any user_id is invalid
+    """
+    user_ids = list(user_ids)
+    # Reject bad input before any request is issued
+    for user_id in user_ids:
+        _check_user_id(user_id)
+    unique_ids = list(dict.fromkeys(user_ids))
+    if not unique_ids:
+        return {}
+    workers = min(len(unique_ids), _POOL_MAXSIZE)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(fetch_user_data, unique_ids)
+        return dict(zip(unique_ids, results))
+
+
+def _check_user_id(user_id: int) -> None:
+    """Raise ValueError unless user_id is a positive integer."""
     if not isinstance(user_id, int) or user_id <= 0:
         raise ValueError("User ID must be a positive integer")
+
+
+def _fetch_user_payload(user_id: int) -> Optional[bytes]:
+    """Fetch a user's raw JSON payload from the API, or None if missing."""
     url = f"https://api.example.com/users/{user_id}"
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        return response.json()
+        response = _SESSION.get(url, timeout=10)
     except requests.exceptions.Timeout:
         raise NetworkError(f"Timeout while fetching user {user_id}")
     except requests.exceptions.ConnectionError:
         raise NetworkError(f"Connection error while fetching user {user_id}")
-    except requests.exceptions.HTTPError as e:
-        if e.response.status_code == 404:
-            return None
-        raise NetworkError(f"HTTP error {e.response.status_code}: {e}")
     except requests.exceptions.RequestException as e:
         raise NetworkError(f"Request failed: {e}")
+    # Dispatch on the status code directly instead of raising and catching
+    # HTTPError via raise_for_status()
+    status = response.status_code
+    if status == 404:
+        return None
+    if status >= 400:
+        raise NetworkError(f"HTTP error {status} for url: {url}")
+    return response.content
+
+
+def _decode_user(payload: bytes) -> Dict[str, Any]:
+    """Decode a user JSON payload, raising NetworkError if it is invalid."""
+    try:
+        return _json.loads(payload)
     except ValueError as e:
         raise NetworkError(f"Invalid JSON response: {e}")
 
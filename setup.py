@@ -0,0 +1,27 @@
+"""
+Build script for the robust_code module.
+
+When mypyc is installed, robust_code.py is compiled to a C extension that
+is imported in place of the pure-Python source:
+
+    pip install mypy
+    python setup.py build_ext --inplace
+
+Without mypyc the module is installed as plain Python.
+"""
+
+from setuptools import setup
+
+try:
+    from mypyc.build import mypycify
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = mypycify(["robust_code.py"])
+
+setup(
+    name="python-best-pratices",
+    py_modules=["robust_code"],
+    install_requires=["requests"],
+    ext_modules=ext_modules,
+)